@@ -25,6 +25,9 @@ class I18nFolderFiles(Files):
 
     locale = None
     translated = False
+    _dest_paths = None
+    _page_urls = None
+    _src_paths = None
 
     def append(self, file):
         """
@@ -33,11 +36,21 @@ class I18nFolderFiles(Files):
 
         The first I18nFolderFile is sufficient to cover all their possible localized versions.
         """
-        for inside_file in self:
-            if inside_file.dest_path == file.dest_path:
-                return
+        if self._dest_paths is None:
+            self._dest_paths = {inside_file.dest_path for inside_file in self}
+        if file.dest_path in self._dest_paths:
+            return
+        self._dest_paths.add(file.dest_path)
+        self._page_urls = None
+        self._src_paths = None
         super().append(file)
 
+    def remove(self, file):
+        self._dest_paths = None
+        self._page_urls = None
+        self._src_paths = None
+        super().remove(file)
+
     def __contains__(self, path):
         """
         Return a bool stipulating whether or not we found a translated version
@@ -47,7 +60,7 @@ class I18nFolderFiles(Files):
         mkdocs.structure.pages / path_to_url() method to point to the localized
         version of the file, if present.
         """
-        return True if self.get_file_from_path(path) else False
+        return self.get_file_from_path(path) is not None
 
     def get_file_from_path(self, path):
         """Return a File instance with File.src_path equal to path."""
@@ -58,19 +71,27 @@ class I18nFolderFiles(Files):
             expected_src_path.relative_to(root_folder),
             Path(self.locale) / Path(expected_src_path),
         ]
-        for src_path in filter(lambda s: Path(s) in expected_src_paths, self.src_paths):
-            return self.src_paths.get(os.path.normpath(src_path))
+        # look the expected paths up instead of building a Path for every file,
+        # the src_paths mapping is rebuilt on each access by mkdocs>=1.4
+        if self._src_paths is None:
+            self._src_paths = self.src_paths
+        for src_path in expected_src_paths:
+            file = self._src_paths.get(str(src_path))
+            if file is not None:
+                return file
 
     def get_localized_page_from_url(self, url, language):
         """Return the I18nFolderFile instance from our files that match the given url and language"""
         if language:
             url = f"{language}/{url}"
         url = url.rstrip(".") or "."
-        for file in self:
-            if not file.is_documentation_page():
-                continue
-            if file.url == url:
-                return file
+        if self._page_urls is None:
+            # index documentation pages by url once instead of scanning all
+            # the files for every lookup
+            self._page_urls = {}
+            for file in self.documentation_pages():
+                self._page_urls.setdefault(file.url, file)
+        return self._page_urls.get(url)
 
 
 class I18nFolderFile(File):
@@ -78,6 +99,8 @@ class I18nFolderFile(File):
     This is a i18n aware version of a mkdocs.structure.files.File
     """
 
+    _non_i18n_src_path = None
+
     def __init__(
         self,
         file_from,
@@ -116,13 +139,13 @@ class I18nFolderFile(File):
             # non localized root folder, file should be copied as-is
             # in the destination language path
             self.locale = self.dest_language
-            self.dest_path = Path(self.locale) / Path(file_from.dest_path)
-            self.abs_dest_path = Path(self.site_dir) / Path(self.dest_path)
+            self.dest_path = os.path.join(self.locale, file_from.dest_path)
+            self.abs_dest_path = os.path.join(self.site_dir, self.dest_path)
         elif language == "":
             # default version file
             self.locale = self.default_language
             self.dest_path = Path(self.initial_dest_path).relative_to(self.locale)
-            self.abs_dest_path = Path(self.site_dir) / Path(self.dest_path)
+            self.abs_dest_path = os.path.join(self.site_dir, self.dest_path)
         else:
             # in localized folder file
             self.locale = self.dest_language
@@ -155,21 +178,24 @@ class I18nFolderFile(File):
         """
         Return the path of the given page without any suffix.
         """
-        if self._is_localized() is None:
-            non_i18n_src_path = Path(self.initial_src_path).with_suffix("")
-        else:
-            non_i18n_src_path = (
-                Path(self.initial_src_path).with_suffix("").with_suffix("")
-            )
-        return non_i18n_src_path
+        # the initial_src_path never changes so compute this only once
+        if self._non_i18n_src_path is None:
+            if self._is_localized() is None:
+                self._non_i18n_src_path = Path(self.initial_src_path).with_suffix("")
+            else:
+                self._non_i18n_src_path = (
+                    Path(self.initial_src_path).with_suffix("").with_suffix("")
+                )
+        return self._non_i18n_src_path
 
     def _is_localized(self):
         """
         Returns the locale detected in the file's suffixes <name>.<locale>.<suffix>.
         """
+        initial_file_suffixes = Path(self.initial_src_path).suffixes
+        initial_file_suffix = self.suffix
         for language in self.all_languages:
-            initial_file_suffixes = Path(self.initial_src_path).suffixes
-            expected_suffixes = [f".{language}", Path(self.initial_src_path).suffix]
+            expected_suffixes = [f".{language}", initial_file_suffix]
             if len(initial_file_suffixes) >= len(expected_suffixes):
                 if (
                     # fmt: off
@@ -318,7 +344,9 @@ def on_files(self, files, config):
                 page.alternates[language] = alternate
             else:
                 log.warning(
-                    f"could not find '{language}' alternate for the default version of page '{page.src_path}'"
+                    "could not find '%s' alternate for the default version of page '%s'",
+                    language,
+                    page.src_path,
                 )
 
     return main_files
@@ -328,7 +356,7 @@ def on_nav(self, nav, config, files):
     """ """
     # translate default nav, see #113
     if self._maybe_translate_titles(self.default_language, nav):
-        log.info(f"Translated default navigation to {self.default_language}")
+        log.info("Translated default navigation to %s", self.default_language)
 
     # check if the navigation is manually configured, see #145
     manual_nav = config.get("nav") is not None
@@ -347,8 +375,10 @@ def on_nav(self, nav, config, files):
             if self.i18n_navs[language].items[0].children is None:
                 # the structure is weird, say it but do not crash hard, see #152
                 log.warning(
-                    f"The structure of folder '{config['docs_dir']}/{language}' "
-                    "does not look right, expect navigation or url inconsistencies"
+                    "The structure of folder '%s/%s' "
+                    "does not look right, expect navigation or url inconsistencies",
+                    config["docs_dir"],
+                    language,
                 )
             else:
                 # the expected folder structure starts with a [Section(title='LANG')]
@@ -356,11 +386,11 @@ def on_nav(self, nav, config, files):
                 self.i18n_navs[language].items = (
                     self.i18n_navs[language].items[0].children
                 )
+            if config["use_directory_urls"] is True:
+                expected_url = f"{language}/"
+            else:
+                expected_url = f"{language}/index.html"
             for item in self.i18n_navs[language]:
-                if config["use_directory_urls"] is True:
-                    expected_url = f"{language}/"
-                else:
-                    expected_url = f"{language}/index.html"
                 if item.is_page and item.url.strip() == expected_url:
                     self.i18n_navs[language].homepage = item
                     break
@@ -378,7 +408,7 @@ def on_nav(self, nav, config, files):
 
         if self.config["nav_translations"].get(language, {}):
             if self._maybe_translate_titles(language, self.i18n_navs[language]):
-                log.info(f"Translated navigation to {language}")
+                log.info("Translated navigation to %s", language)
 
         if language == self.default_language:
             for section in nav.items:
@@ -390,11 +420,11 @@ def on_nav(self, nav, config, files):
                     raise Exception(
                         f"could not find default version Section(title='{self.default_language.capitalize()}')"
                     )
+            if config["use_directory_urls"] is True:
+                expected_url = ""
+            else:
+                expected_url = "index.html"
             for item in nav:
-                if config["use_directory_urls"] is True:
-                    expected_url = ""
-                else:
-                    expected_url = "index.html"
                 if item.is_page and item.url == expected_url:
                     nav.homepage = item
                     break
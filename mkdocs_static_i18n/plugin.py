@@ -1,6 +1,7 @@
 import logging
 from collections import defaultdict
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 from mkdocs import __version__ as mkdocs_version
@@ -18,43 +19,64 @@ try:
 except ImportError:
     install_translations = None
 
-try:
-    import pkg_resources
+log = logging.getLogger("mkdocs.plugins." + __name__)
 
-    material_dist = pkg_resources.get_distribution("mkdocs-material")
-    material_version = material_dist.version
-    material_languages = [
-        lang.split(".html")[0]
-        for lang in material_dist.resource_listdir("material/partials/languages")
+LUNR_LANGUAGES = frozenset(
+    [
+        "ar",
+        "da",
+        "de",
+        "en",
+        "es",
+        "fi",
+        "fr",
+        "hu",
+        "it",
+        "ja",
+        "nl",
+        "no",
+        "pt",
+        "ro",
+        "ru",
+        "sv",
+        "th",
+        "tr",
+        "vi",
     ]
-except Exception:
-    material_languages = []
-    material_version = None
+)
+MKDOCS_THEMES = frozenset(["mkdocs", "readthedocs"])
+
+
+@lru_cache(maxsize=1)
+def _get_material_info():
+    """
+    Return the installed mkdocs-material version and its supported languages.
+
+    Importing pkg_resources is slow so this is only done once and when needed.
+    """
+    try:
+        import pkg_resources
+
+        material_dist = pkg_resources.get_distribution("mkdocs-material")
+        material_version = material_dist.version
+        material_languages = frozenset(
+            lang[: -len(".html")]
+            for lang in material_dist.resource_listdir("material/partials/languages")
+            if lang.endswith(".html")
+        )
+    except Exception:
+        material_languages = frozenset()
+        material_version = None
+    return material_version, material_languages
 
-log = logging.getLogger("mkdocs.plugins." + __name__)
 
-LUNR_LANGUAGES = [
-    "ar",
-    "da",
-    "de",
-    "en",
-    "es",
-    "fi",
-    "fr",
-    "hu",
-    "it",
-    "ja",
-    "nl",
-    "no",
-    "pt",
-    "ro",
-    "ru",
-    "sv",
-    "th",
-    "tr",
-    "vi",
-]
-MKDOCS_THEMES = ["mkdocs", "readthedocs"]
+def __getattr__(name):
+    # keep exposing the material_version and material_languages module attributes
+    if name == "material_version":
+        return _get_material_info()[0]
+    if name == "material_languages":
+        return _get_material_info()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class I18n(BasePlugin):
@@ -78,44 +100,51 @@ class I18n(BasePlugin):
         self.i18n_files = defaultdict(list)
         self.i18n_navs = {}
         self.material_alternates = None
+        self.material_alternates_base = None
+        self.search_plugin = None
+        self.with_pdf_plugin = None
 
     @staticmethod
     def _is_url(value):
         return value.startswith("http://") or value.startswith("https://")
 
-    def _dict_replace_value(self, directory, old, new):
+    def _replace_path_value(self, value, replacements):
         """
-        Return a copy of the given dict with value replaced.
+        Return the given path value replaced and normalized.
+        """
+        value = replacements.get(str(value), value)
+        if not self._is_url(value):
+            value = str(Path(value))
+            value = replacements.get(value, value)
+        return value
+
+    def _dict_replace_value(self, directory, replacements):
+        """
+        Return a copy of the given dict with values replaced.
         """
         x = {}
         for k, v in directory.items():
             if isinstance(v, dict):
-                v = self._dict_replace_value(v, old, new)
+                v = self._dict_replace_value(v, replacements)
             elif isinstance(v, list):
-                v = self._list_replace_value(v, old, new)
+                v = self._list_replace_value(v, replacements)
             elif isinstance(v, str) or isinstance(v, Path):
-                if str(v) == str(old):
-                    v = new
-                if not self._is_url(v):
-                    v = str(Path(v))
+                v = self._replace_path_value(v, replacements)
             x[k] = v
         return x
 
-    def _list_replace_value(self, listing, old, new):
+    def _list_replace_value(self, listing, replacements):
         """
-        Return a copy of the given list with value replaced.
+        Return a copy of the given list with values replaced.
         """
         x = []
         for e in listing:
             if isinstance(e, list):
-                e = self._list_replace_value(e, old, new)
+                e = self._list_replace_value(e, replacements)
             elif isinstance(e, dict):
-                e = self._dict_replace_value(e, old, new)
+                e = self._dict_replace_value(e, replacements)
             elif isinstance(e, str) or isinstance(e, Path):
-                if str(e) == str(old):
-                    e = new
-                if not self._is_url(e):
-                    e = str(Path(e))
+                e = self._replace_path_value(e, replacements)
             x.append(e)
         return x
 
@@ -182,33 +211,42 @@ class I18n(BasePlugin):
                 self.all_languages.append(language)
         if self.default_language not in self.all_languages:
             self.all_languages.insert(0, self.default_language)
+        # Map every language to its localized site_name once, this is looked up
+        # for every page rendered
+        self.localized_site_names = {
+            language: lang_config["site_name"]
+            for language, lang_config in self.config["languages"].items()
+        }
         # Get our placement index in the plugins config list
         try:
             i18n_index = list(config["plugins"].keys()).index("i18n")
         except ValueError:
             i18n_index = -1
+        # Keep a handle on the plugins we interact with
+        self.search_plugin = config["plugins"].get("search")
+        self.with_pdf_plugin = config["plugins"].get("with-pdf")
         # Make sure with-pdf is controlled by us, see #110
         # We will only control it for the main language, localized PDF are
         # generated on the 'on_post_build' method
-        if "with-pdf" in config["plugins"]:
+        if self.with_pdf_plugin:
             with_pdf_index = list(config["plugins"].keys()).index("with-pdf")
             if with_pdf_index > i18n_index:
-                config["plugins"]["with-pdf"].on_config(config)
+                self.with_pdf_plugin.on_config(config)
             if mkdocs_version >= "1.4":
                 # TODO: drop me after we start using mkdocs plugin prioritization
                 log.warning(
                     "The 'with-pdf' plugin should be listed AFTER 'i18n' in the 'plugins' option"
                 )
             else:
+                config["plugins"].move_to_end("with-pdf", last=False)
                 for events in config["plugins"].events.values():
-                    config["plugins"].move_to_end("with-pdf", last=False)
-                    for idx, event in enumerate(list(events)):
-                        try:
-                            if str(event.__module__) == "mkdocs_with_pdf.plugin":
-                                events.pop(idx)
-                        except AttributeError:
-                            # partials don't have a module
-                            pass
+                    # partials don't have a module
+                    events[:] = [
+                        event
+                        for event in events
+                        if getattr(event, "__module__", None)
+                        != "mkdocs_with_pdf.plugin"
+                    ]
         # Make sure awesome-pages is always called before us, see #65
         if "awesome-pages" in config["plugins"]:
             awesome_index = list(config["plugins"].keys()).index("awesome-pages")
@@ -239,32 +277,38 @@ class I18n(BasePlugin):
         else:
             hooks = None
         plugins = config.pop("plugins")
-        for language in self.all_languages:
-            self.i18n_configs[language] = deepcopy(config)
-            self.i18n_configs[language]["plugins"] = plugins
+        # Always give them back to the config, even if a copy fails
+        try:
+            for language in self.all_languages:
+                self.i18n_configs[language] = deepcopy(config)
+                self.i18n_configs[language]["plugins"] = plugins
+                if hooks:
+                    self.i18n_configs[language]["hooks"] = hooks
+        finally:
+            config["plugins"] = plugins
             if hooks:
-                self.i18n_configs[language]["hooks"] = hooks
-        config["plugins"] = plugins
-        if hooks:
-            config["hooks"] = hooks
+                config["hooks"] = hooks
         # Set theme locale to default language
         if self.default_language != "en":
             if config["theme"].name in MKDOCS_THEMES:
                 if mkdocs_version >= "1.2":
                     config["theme"]["locale"] = self.default_language
                     log.info(
-                        f"Setting the default 'theme.locale' option to '{self.default_language}'"
+                        "Setting the default 'theme.locale' option to '%s'",
+                        self.default_language,
                     )
             elif config["theme"].name == "material":
                 config["theme"].language = self.default_language
                 log.info(
-                    f"Setting the default 'theme.language' option to '{self.default_language}'"
+                    "Setting the default 'theme.language' option to '%s'",
+                    self.default_language,
                 )
         # Skip language builds requested?
         if self.config["default_language_only"] is True:
             return config
         # Support for mkdocs-material>=7.1.0 language selector
         if self.config["material_alternate"] and len(self.all_languages) > 1:
+            material_version, _ = _get_material_info()
             if material_version and material_version >= "7.1.0":
                 if not config["extra"].get("alternate") or kwargs.get("force"):
                     config["extra"]["alternate"] = []
@@ -306,8 +350,8 @@ class I18n(BasePlugin):
                         if not alternate.get("link", "").startswith("./"):
                             log.info(
                                 "The 'extra.alternate' configuration contains a "
-                                "'link' option that should starts with './' in "
-                                f"{alternate}"
+                                "'link' option that should starts with './' in %s",
+                                alternate,
                             )
 
                 if "navigation.instant" in config["theme"]._vars.get("features", []):
@@ -317,20 +361,22 @@ class I18n(BasePlugin):
                     )
                 else:
                     self.material_alternates = config["extra"].get("alternate")
+                    self.material_alternates_base = None
         # Support for the search plugin lang
-        if self.config["search_reconfigure"] and "search" in config["plugins"]:
-            search_langs = config["plugins"]["search"].config["lang"] or []
+        if self.config["search_reconfigure"] and self.search_plugin:
+            search_langs = self.search_plugin.config["lang"] or []
             for language in self.all_languages:
                 if language in LUNR_LANGUAGES:
                     if language not in search_langs:
                         search_langs.append(language)
                         log.info(
-                            f"Adding '{language}' to the 'plugins.search.lang' option"
+                            "Adding '%s' to the 'plugins.search.lang' option", language
                         )
                 else:
                     log.warning(
-                        f"Language '{language}' is not supported by "
-                        f"lunr.js, not setting it in the 'plugins.search.lang' option"
+                        "Language '%s' is not supported by "
+                        "lunr.js, not setting it in the 'plugins.search.lang' option",
+                        language,
                     )
         # Report misconfigured nav_translations, see #66
         if self.config["nav_translations"]:
@@ -340,8 +386,9 @@ class I18n(BasePlugin):
             else:
                 log.info(
                     "Ignoring 'nav_translations' option: expected a language key "
-                    f"from {list(self.config['languages'].keys())}, got "
-                    f"{list(self.config['nav_translations'].keys())}"
+                    "from %s, got %s",
+                    list(self.config["languages"].keys()),
+                    list(self.config["nav_translations"].keys()),
                 )
                 self.config["nav_translations"] = {}
         # Install a i18n aware version of sitemap.xml if not provided by the user
@@ -354,6 +401,23 @@ class I18n(BasePlugin):
             config["theme"].dirs.insert(0, str(custom_i18n_sitemap_dir))
         return config
 
+    def _get_material_alternates(self, config):
+        """
+        Return a copy of the material alternates with their base link
+        computed so that only the page url has to be appended to them.
+        """
+        material_alternates = deepcopy(self.material_alternates)
+        for alternate in material_alternates:
+            fixed_link = alternate.get("fixed_link")
+            if fixed_link:
+                alternate["link"] = fixed_link
+                continue
+            if config.get("use_directory_urls") is False:
+                alternate["link"] = alternate["link"].replace("/index.html", "", 1)
+            if not alternate["link"].endswith("/"):
+                alternate["link"] += "/"
+        return material_alternates
+
     def on_files(self, files, config):
         """
         Construct the main + lang specific file tree which will be used to
@@ -373,6 +437,9 @@ class I18n(BasePlugin):
         This function localizes the given pages to their translated
         counterparts if available.
         """
+        # Collect all the replacements first so that the navigation is only
+        # walked once whatever the number of localized pages
+        replacements = {}
         for i18n_page in files.documentation_pages():
             if Path(i18n_page.src_path).suffixes == [f".{language}", ".md"]:
                 config_path_expects = [
@@ -382,11 +449,11 @@ class I18n(BasePlugin):
                     ),
                 ]
                 for config_path in config_path_expects:
-                    self.i18n_configs[language]["nav"] = self._list_replace_value(
-                        self.i18n_configs[language]["nav"],
-                        config_path,
-                        i18n_page.src_path,
-                    )
+                    replacements.setdefault(str(config_path), i18n_page.src_path)
+        if replacements:
+            self.i18n_configs[language]["nav"] = self._list_replace_value(
+                self.i18n_configs[language]["nav"], replacements
+            )
 
     def _maybe_translate_titles(self, language, items):
         translated = False
@@ -395,9 +462,12 @@ class I18n(BasePlugin):
             for item in items:
                 if hasattr(item, "title") and item.title in translated_nav:
                     log.debug(
-                        f"Translating {type(item).__name__} title '{item.title}' "
-                        f"({self.default_language}) to "
-                        f"'{translated_nav[item.title]}' ({language})"
+                        "Translating %s title '%s' (%s) to '%s' (%s)",
+                        type(item).__name__,
+                        item.title,
+                        self.default_language,
+                        translated_nav[item.title],
+                        language,
                     )
                     item.title = translated_nav[item.title]
                     translated = True
@@ -417,9 +487,8 @@ class I18n(BasePlugin):
         else:
             nav = folder_structure.on_nav(self, nav, config, files)
         # Manually trigger with-pdf on_nav, see #110
-        with_pdf_plugin = config["plugins"].get("with-pdf")
-        if with_pdf_plugin:
-            with_pdf_plugin.on_nav(nav, config, files)
+        if self.with_pdf_plugin:
+            self.with_pdf_plugin.on_nav(nav, config, files)
         return nav
 
     def _fix_search_duplicates(self, search_plugin):
@@ -431,34 +500,30 @@ class I18n(BasePlugin):
         When this happens, we favor the default language location if its
         content is the same as its /language counterpart.
         """
-        default_lang_entries = filter(
-            lambda x: not x["location"].startswith(
-                tuple(self.config["languages"].keys())
-            ),
-            search_plugin.search_index._entries,
-        )
-        target_lang_entries = list(
-            filter(
-                lambda x: x["location"].startswith(
-                    tuple(self.config["languages"].keys())
-                ),
-                search_plugin.search_index._entries,
-            )
-        )
+        language_prefixes = tuple(self.config["languages"].keys())
+        entries = search_plugin.search_index._entries
+        # Index the localized entries by title and text so that default language
+        # entries are only compared against their actual duplicates
+        default_lang_entries = []
+        target_lang_entries = defaultdict(list)
+        for entry in entries:
+            if entry["location"].startswith(language_prefixes):
+                target_lang_entries[(entry["title"], entry["text"])].append(entry)
+            else:
+                default_lang_entries.append(entry)
+        duplicated_entries = set()
         for default_lang_entry in default_lang_entries:
-            duplicated_entries = filter(
-                lambda x: x["title"] == default_lang_entry["title"]
-                and x["location"].endswith(x["location"])
-                and x["text"] == default_lang_entry["text"],
-                target_lang_entries,
-            )
-            for duplicated_entry in duplicated_entries:
-                if duplicated_entry in search_plugin.search_index._entries:
-                    log.debug(
-                        f"removed duplicated search entry: {duplicated_entry['title']} "
-                        f"{duplicated_entry['location']}"
-                    )
-                    search_plugin.search_index._entries.remove(duplicated_entry)
+            for duplicated_entry in target_lang_entries.pop(
+                (default_lang_entry["title"], default_lang_entry["text"]), []
+            ):
+                log.debug(
+                    "removed duplicated search entry: %s %s",
+                    duplicated_entry["title"],
+                    duplicated_entry["location"],
+                )
+                duplicated_entries.add(id(duplicated_entry))
+        if duplicated_entries:
+            entries[:] = [e for e in entries if id(e) not in duplicated_entries]
 
     def on_page_markdown(self, markdown, page, config, files):
         """
@@ -487,23 +552,24 @@ class I18n(BasePlugin):
         context["i18n_page_file_locale"] = page.file.locale_suffix
 
         if self.material_alternates:
-            alternates = deepcopy(self.material_alternates)
+            # compute the base links on first use so that the changes made to
+            # the alternates by other plugins after our on_config are honored
+            if self.material_alternates_base is None:
+                self.material_alternates_base = self._get_material_alternates(config)
+            # only the alternates links differ between pages so a shallow copy of
+            # the precomputed alternates is enough
+            alternates = [
+                dict(alternate) for alternate in self.material_alternates_base
+            ]
             page_url = page.url
-            for language in self.all_languages:
-                if page.url.startswith(f"{language}/"):
-                    prefix_len = len(language) + 1
-                    page_url = page.url[prefix_len:]
-                    break
+            # only the localized versions urls start with their language
+            if page.file.dest_language:
+                language, sep, url = page.url.partition("/")
+                if sep and language in self.all_languages:
+                    page_url = url
 
             for alternate in alternates:
-                if config.get("use_directory_urls") is False:
-                    alternate["link"] = alternate["link"].replace("/index.html", "", 1)
-                fixed_link = alternate.get("fixed_link")
-                if fixed_link:
-                    alternate["link"] = fixed_link
-                else:
-                    if not alternate["link"].endswith("/"):
-                        alternate["link"] += "/"
+                if not alternate.get("fixed_link"):
                     alternate["link"] += page_url
             config["extra"]["alternate"] = alternates
 
@@ -512,10 +578,8 @@ class I18n(BasePlugin):
             # default
             localized_site_name = self.default_language_options["site_name"]
         else:
-            localized_site_name = (
-                self.config["languages"]
-                .get(context["i18n_page_locale"], {})
-                .get("site_name", config["site_name"])
+            localized_site_name = self.localized_site_names.get(
+                context["i18n_page_locale"], config["site_name"]
             )
         config["site_name"] = localized_site_name
 
@@ -526,9 +590,8 @@ class I18n(BasePlugin):
         Some plugins we control ourselves need this event.
         """
         # Manually trigger with-pdf on_nav, see #110
-        with_pdf_plugin = config["plugins"].get("with-pdf")
-        if with_pdf_plugin:
-            with_pdf_plugin.on_post_page(output, page, config)
+        if self.with_pdf_plugin:
+            self.with_pdf_plugin.on_post_page(output, page, config)
         return output
 
     def on_post_build(self, config):
@@ -543,18 +606,23 @@ class I18n(BasePlugin):
 
         dirty = False
         minify_plugin = config["plugins"].get("minify")
-        search_plugin = config["plugins"].get("search")
-        with_pdf_plugin = config["plugins"].get("with-pdf")
+        search_plugin = self.search_plugin
+        with_pdf_plugin = self.with_pdf_plugin
         if with_pdf_plugin:
             with_pdf_plugin.on_post_build(config)
             with_pdf_output_path = with_pdf_plugin.config["output_path"]
+        # the theme is shared by all the languages
+        if config["theme"].name == "material":
+            material_version, material_languages = _get_material_info()
+        else:
+            material_languages = None
         for language, language_config in self.config["languages"].items():
             # Language build disabled by the user, skip
             if language_config["build"] is False:
-                log.info(f"Skipping building {language} documentation")
+                log.info("Skipping building %s documentation", language)
                 continue
 
-            log.info(f"Building {language} documentation")
+            log.info("Building %s documentation", language)
 
             config = self.i18n_configs[language]
             env = self.i18n_configs[language]["theme"].get_env()
@@ -562,14 +630,16 @@ class I18n(BasePlugin):
             nav = self.i18n_navs[language]
 
             # Support mkdocs-material theme language
-            if config["theme"].name == "material":
+            if material_languages is not None:
                 if language in material_languages:
                     config["theme"].language = language
                 else:
                     log.warning(
-                        f"Language {language} is not supported by "
-                        f"mkdocs-material=={material_version}, not setting "
-                        "the 'theme.language' option"
+                        "Language %s is not supported by "
+                        "mkdocs-material==%s, not setting "
+                        "the 'theme.language' option",
+                        language,
+                        material_version,
                     )
 
             # Support mkdocs-minify-plugin
@@ -61,7 +61,9 @@ class Locale(Type):
             unsupported_keys = set(lang_value.keys()).difference(allowed_keys)
             if unsupported_keys:
                 log.warning(
-                    f"'plugins.i18n.languages.{lang_key}' unsupported options: {','.join(unsupported_keys)}"
+                    "'plugins.i18n.languages.%s' unsupported options: %s",
+                    lang_key,
+                    ",".join(unsupported_keys),
                 )
             for key in lang_config:
                 if key in lang_value:
@@ -25,6 +25,9 @@ class I18nFiles(Files):
 
     locale = None
     translated = False
+    _dest_paths = None
+    _page_urls = None
+    _src_paths = None
 
     def append(self, file):
         """
@@ -33,11 +36,21 @@ class I18nFiles(Files):
 
         The first i18nFile is sufficient to cover all their possible localized versions.
         """
-        for inside_file in self:
-            if inside_file.dest_path == file.dest_path:
-                return
+        if self._dest_paths is None:
+            self._dest_paths = {inside_file.dest_path for inside_file in self}
+        if file.dest_path in self._dest_paths:
+            return
+        self._dest_paths.add(file.dest_path)
+        self._page_urls = None
+        self._src_paths = None
         super().append(file)
 
+    def remove(self, file):
+        self._dest_paths = None
+        self._page_urls = None
+        self._src_paths = None
+        super().remove(file)
+
     def __contains__(self, path):
         """
         Return a bool stipulating whether or not we found a translated version
@@ -47,15 +60,7 @@ class I18nFiles(Files):
         mkdocs.structure.pages / path_to_url() method to point to the localized
         version of the file, if present.
         """
-        expected_src_path = Path(path)
-        expected_src_paths = [
-            expected_src_path.with_suffix(f".{self.locale}{expected_src_path.suffix}"),
-            expected_src_path.with_suffix(
-                f".{self.default_locale}{expected_src_path.suffix}"
-            ),
-            expected_src_path,
-        ]
-        return any(filter(lambda s: Path(s) in expected_src_paths, self.src_paths))
+        return self.get_file_from_path(path) is not None
 
     def get_file_from_path(self, path):
         """Return a File instance with File.src_path equal to path."""
@@ -67,8 +72,14 @@ class I18nFiles(Files):
             ),
             expected_src_path,
         ]
-        for src_path in filter(lambda s: Path(s) in expected_src_paths, self.src_paths):
-            return self.src_paths.get(os.path.normpath(src_path))
+        # look the expected paths up instead of building a Path for every file,
+        # the src_paths mapping is rebuilt on each access by mkdocs>=1.4
+        if self._src_paths is None:
+            self._src_paths = self.src_paths
+        for src_path in expected_src_paths:
+            file = self._src_paths.get(str(src_path))
+            if file is not None:
+                return file
 
     def get_localized_page_from_url(self, url, language):
         """Return the I18nFile instance from our files that match the given url and language"""
@@ -79,11 +90,13 @@ class I18nFiles(Files):
         # the url convention again
         if url.endswith("/./"):
             url = url[:-2]
-        for file in self:
-            if not file.is_documentation_page():
-                continue
-            if file.url == url:
-                return file
+        if self._page_urls is None:
+            # index documentation pages by url once instead of scanning all
+            # the files for every lookup
+            self._page_urls = {}
+            for file in self.documentation_pages():
+                self._page_urls.setdefault(file.url, file)
+        return self._page_urls.get(url)
 
 
 class I18nFile(File):
@@ -91,6 +104,8 @@ class I18nFile(File):
     This is a i18n aware version of a mkdocs.structure.files.File
     """
 
+    _non_i18n_src_path = None
+
     def __init__(
         self,
         file_from,
@@ -139,7 +154,7 @@ class I18nFile(File):
             if Path(expected_path).exists():
 
                 self.src_path = expected_path.relative_to(self.docs_dir)
-                self.abs_src_path = Path(self.docs_dir) / Path(self.src_path)
+                self.abs_src_path = os.path.join(self.docs_dir, self.src_path)
                 #
                 self.locale_suffix = locale_suffix
                 if self.locale_suffix:
@@ -150,10 +165,8 @@ class I18nFile(File):
                     self.dest_name = Path(expected_path).name
                 #
                 self.dest_path = self._get_dest_path(use_directory_urls)
-                self.abs_dest_path = (
-                    Path(self.site_dir)
-                    / Path(self.dest_language)
-                    / Path(self.dest_path)
+                self.abs_dest_path = os.path.join(
+                    self.site_dir, self.dest_language, self.dest_path
                 )
                 break
         else:
@@ -191,21 +204,24 @@ class I18nFile(File):
         """
         Return the path of the given page without any suffix.
         """
-        if self._is_localized() is None:
-            non_i18n_src_path = Path(self.initial_src_path).with_suffix("")
-        else:
-            non_i18n_src_path = (
-                Path(self.initial_src_path).with_suffix("").with_suffix("")
-            )
-        return non_i18n_src_path
+        # the initial_src_path never changes so compute this only once
+        if self._non_i18n_src_path is None:
+            if self._is_localized() is None:
+                self._non_i18n_src_path = Path(self.initial_src_path).with_suffix("")
+            else:
+                self._non_i18n_src_path = (
+                    Path(self.initial_src_path).with_suffix("").with_suffix("")
+                )
+        return self._non_i18n_src_path
 
     def _is_localized(self):
         """
         Returns the locale detected in the file's suffixes <name>.<locale>.<suffix>.
         """
+        initial_file_suffixes = Path(self.initial_src_path).suffixes
+        initial_file_suffix = self.suffix
         for language in self.all_languages:
-            initial_file_suffixes = Path(self.initial_src_path).suffixes
-            expected_suffixes = [f".{language}", Path(self.initial_src_path).suffix]
+            expected_suffixes = [f".{language}", initial_file_suffix]
             if len(initial_file_suffixes) >= len(expected_suffixes):
                 if (
                     # fmt: off
@@ -312,7 +328,9 @@ def on_files(self, files, config):
                 and main_i18n_file.src_path == i18n_file.src_path
             ):
                 log.debug(
-                    f"file {main_i18n_file.src_path} is missing translation in '{language}'"
+                    "file %s is missing translation in '%s'",
+                    main_i18n_file.src_path,
+                    language,
                 )
 
     # these comments are here to help me debug later if needed
@@ -337,7 +355,9 @@ def on_files(self, files, config):
                 page.alternates[language] = alternate
             else:
                 log.warning(
-                    f"could not find '{language}' alternate for the default version of page '{page.src_path}'"
+                    "could not find '%s' alternate for the default version of page '%s'",
+                    language,
+                    page.src_path,
                 )
     # localized versions
     # for files in self.i18n_files.values():
@@ -357,7 +377,10 @@ def on_files(self, files, config):
     #                 page.alternates[language] = alternate
     #             else:
     #                 log.warning(
-    #                     f"could not find '{language}' alternate for the '{files.locale}' version of page '{page.src_path}'"
+    #                     "could not find '%s' alternate for the '%s' version of page '%s'",
+    #                     language,
+    #                     files.locale,
+    #                     page.src_path,
     #                 )
 
     return main_files
@@ -367,7 +390,7 @@ def on_nav(self, nav, config, files):
     """ """
     # translate default nav, see #113
     if self._maybe_translate_titles(self.default_language, nav):
-        log.info(f"Translated default navigation to {self.default_language}")
+        log.info("Translated default navigation to %s", self.default_language)
 
     for language, lang_config in self.config["languages"].items():
         # skip nav generation for languages that we do not build
@@ -391,14 +414,15 @@ def on_nav(self, nav, config, files):
 
         if self.config["nav_translations"].get(language, {}):
             if self._maybe_translate_titles(language, self.i18n_navs[language]):
-                log.info(f"Translated navigation to {language}")
+                log.info("Translated navigation to %s", language)
 
         # detect and set nav homepage
+        expected_urls = (f"{language}/", f"{language}/index.html")
         for page in self.i18n_files[language].documentation_pages():
-            if page.url in (f"{language}/", f"{language}/index.html"):
+            if page.url in expected_urls:
                 self.i18n_navs[language].homepage = page
                 break
         else:
-            log.warning(f"could not find homepage for locale '{language}'")
+            log.warning("could not find homepage for locale '%s'", language)
 
     return nav
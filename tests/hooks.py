@@ -1,3 +1,15 @@
+page_contexts = []
+page_alternates = {}
+
+
 def on_nav(nav, config, files):
     print("on_nav hook called")
     return nav
+
+
+def on_page_context(context, page, config, nav):
+    page_contexts.append(context)
+    page_alternates[(page.file.dest_language, page.url)] = config["extra"].get(
+        "alternate"
+    )
+    return context
@@ -0,0 +1,4 @@
+def on_config(config):
+    for alternate in config["extra"].get("alternate") or []:
+        alternate["name"] = alternate["name"].upper()
+    return config
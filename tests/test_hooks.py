@@ -1,3 +1,5 @@
+import tempfile
+
 from mkdocs.commands.build import build
 from mkdocs.config.base import load_config
 
@@ -19,3 +21,29 @@ def test_hooks_working():
         hooks=["hooks.py"],
     )
     build(mkdocs_config)
+
+
+def test_hooks_page_context_i18n_config():
+    with tempfile.TemporaryDirectory(prefix="mkdocs_tests_") as site_dir:
+        mkdocs_config = load_config(
+            "tests/mkdocs_base.yml",
+            theme={"name": "mkdocs"},
+            docs_dir="docs_suffix_structure/",
+            site_dir=site_dir,
+            site_url="http://localhost",
+            extra_javascript=[],
+            plugins={
+                "i18n": {
+                    "default_language": "en",
+                    "languages": {"fr": "français", "en": "english"},
+                },
+            },
+            hooks=["hooks.py"],
+        )
+        hooks = mkdocs_config["hooks"]["hooks.py"]
+        hooks.page_contexts.clear()
+        build(mkdocs_config)
+        i18n_plugin = mkdocs_config["plugins"]["i18n"]
+        assert hooks.page_contexts
+        for context in hooks.page_contexts:
+            assert context["i18n_config"] is i18n_plugin.config
@@ -1,3 +1,6 @@
+import tempfile
+from pathlib import Path
+
 from mkdocs.commands.build import build
 from mkdocs.config.base import load_config
 
@@ -185,3 +188,72 @@ def test_plugin_language_selector_fixed_link_with_static_alternate():
         {"name": "français", "link": "./fr/", "lang": "fr"},
     ]
     build(mkdocs_config)
+
+
+def test_plugin_language_selector_default_page_in_language_named_folder():
+    with tempfile.TemporaryDirectory(
+        prefix="mkdocs_tests_"
+    ) as site_dir, tempfile.TemporaryDirectory(prefix="mkdocs_tests_") as docs_dir:
+        Path(docs_dir, "index.md").write_text("# Home")
+        Path(docs_dir, "fr").mkdir()
+        Path(docs_dir, "fr", "foo.md").write_text("# Foo")
+        mkdocs_config = load_config(
+            "tests/mkdocs_base.yml",
+            theme={"name": "material"},
+            use_directory_urls=True,
+            docs_dir=docs_dir,
+            site_dir=site_dir,
+            site_url="http://localhost",
+            extra_javascript=[],
+            plugins={
+                "i18n": {
+                    "default_language": "en",
+                    "languages": {"fr": "français", "en": "english"},
+                }
+            },
+            hooks=["hooks.py"],
+        )
+        hooks = mkdocs_config["hooks"]["hooks.py"]
+        hooks.page_alternates.clear()
+        build(mkdocs_config)
+        # the default version page keeps its 'fr' folder in the alternates links
+        assert [a["link"] for a in hooks.page_alternates[("", "fr/foo/")]] == [
+            "./fr/foo/",
+            "./fr/fr/foo/",
+        ]
+        # the localized version page only loses its language prefix
+        assert [a["link"] for a in hooks.page_alternates[("fr", "fr/fr/foo/")]] == [
+            "./fr/foo/",
+            "./fr/fr/foo/",
+        ]
+
+
+def test_plugin_language_selector_alternates_changed_after_on_config():
+    with tempfile.TemporaryDirectory(prefix="mkdocs_tests_") as site_dir:
+        mkdocs_config = load_config(
+            "tests/mkdocs_base.yml",
+            theme={"name": "material"},
+            use_directory_urls=True,
+            docs_dir="docs_suffix_structure/",
+            site_dir=site_dir,
+            site_url="http://localhost",
+            extra_javascript=[],
+            plugins={
+                "i18n": {
+                    "default_language": "en",
+                    "languages": {"fr": "français", "en": "english"},
+                }
+            },
+            hooks=["hooks.py", "hooks_alternates.py"],
+        )
+        hooks = mkdocs_config["hooks"]["hooks.py"]
+        hooks.page_alternates.clear()
+        build(mkdocs_config)
+        # the alternates names were upper cased by a hook after our on_config
+        assert hooks.page_alternates
+        for alternates in hooks.page_alternates.values():
+            assert [a["name"] for a in alternates] == ["ENGLISH", "FRANÇAIS"]
+        assert [a["link"] for a in hooks.page_alternates[("fr", "fr/")]] == [
+            "./",
+            "./fr/",
+        ]
@@ -1,3 +1,4 @@
+import tempfile
 from copy import deepcopy
 from pathlib import Path
 
@@ -52,6 +53,33 @@ def test_plugin_static_nav(config_plugin_static_nav):
     assert i18n_plugin.i18n_configs["fr"]["nav"] == FR_STATIC_NAV
 
 
+def test_plugin_static_nav_dot_slash_entries():
+    with tempfile.TemporaryDirectory(prefix="mkdocs_tests_") as site_dir:
+        config = load_config(
+            "tests/mkdocs_i18n_static_nav.yml",
+            docs_dir="docs_suffix_structure/",
+            site_dir=site_dir,
+            nav=[
+                {"Home": "./index.md"},
+                {"Topic1": [{"Named File": "./topic1/named_file.en.md"}]},
+                {"Topic2": "./index.en.md"},
+                {"External": "https://ultrabug.fr"},
+            ],
+        )
+        i18n_plugin = config["plugins"]["i18n"]
+        #
+        files = get_files(config)
+        config = i18n_plugin.on_config(config)
+        files = i18n_plugin.on_files(files, config)
+        nav = get_navigation(files, config)
+        nav = i18n_plugin.on_nav(nav, config, files)
+        #
+        # './' prefixed entries are normalized and localized like the others,
+        # the first one compared included
+        assert i18n_plugin.i18n_configs["en"]["nav"] == EN_STATIC_NAV
+        assert i18n_plugin.i18n_configs["fr"]["nav"] == FR_STATIC_NAV
+
+
 def test_plugin_translated_nav(config_plugin_translated_nav):
     config = config_plugin_translated_nav
     i18n_plugin = config["plugins"]["i18n"]
@@ -2,6 +2,9 @@ from pathlib import Path
 
 from mkdocs.commands.build import build
 from mkdocs.config.base import load_config
+from mkdocs.structure.files import File
+
+from mkdocs_static_i18n.folder_structure import I18nFolderFiles
 
 USE_DIRECTORY_URLS = [
     Path("404.html"),
@@ -552,3 +555,18 @@ def test_plugin_no_use_directory_urls_default_language_only_folder_structure():
         [f.relative_to(site_dir) for f in Path(site_dir).glob("**/image*.*")]
     )
     assert sorted(generate_site) == sorted(PLUGIN_NO_USE_DIRECTORY_URLS_DEFAULT_ONLY)
+
+
+def test_folder_structure_get_file_from_path_candidates_order():
+    files = I18nFolderFiles([])
+    files.locale = "fr"
+    nested_file = File("fr/fr/page.md", "docs", "site", True)
+    files.append(nested_file)
+    # the candidates are looked up in their expected order, not in the
+    # order the files were added to the collection
+    assert files.get_file_from_path("fr/page.md") is nested_file
+    page_file = File("fr/page.md", "docs", "site", True)
+    files.append(page_file)
+    assert files.get_file_from_path("fr/page.md") is page_file
+    assert files.get_file_from_path("fr/fr/page.md") is nested_file
+    assert "fr/missing.md" not in files